@@ -218,17 +218,17 @@ impl EnvGuard {
         let lock = ENV_LOCK
             .lock()
             .unwrap_or_else(std::sync::PoisonError::into_inner);
-        let mut saved: Vec<(String, Option<String>)> = Vec::new();
 
-        // Snapshot and clear all ambient SUBMATE__* vars first.
-        let ambient: Vec<String> = std::env::vars()
-            .map(|(k, _)| k)
-            .filter(|k| k.starts_with("SUBMATE__"))
+        // Snapshot and clear all ambient SUBMATE__* vars first. The snapshot
+        // keeps the values from the one environment scan instead of looking
+        // each key up again.
+        let mut saved: Vec<(String, Option<String>)> = std::env::vars()
+            .filter(|(k, _)| k.starts_with("SUBMATE__"))
+            .map(|(k, v)| (k, Some(v)))
             .collect();
-        for key in ambient {
-            saved.push((key.clone(), std::env::var(&key).ok()));
+        for (key, _) in &saved {
             // TODO: Audit that the environment access only happens in single-threaded code.
-            unsafe { std::env::remove_var(&key) };
+            unsafe { std::env::remove_var(key) };
         }
 
         // Apply overrides, snapshotting any key not already recorded above.
@@ -12,6 +12,12 @@
 /// Canonical PCM WAV header length.
 const WAV_HEADER_LEN: usize = 44;
 
+/// The s16→float scale, named so the decode reads as one scale step. `32768`
+/// is a power of two, so this reciprocal is exact and multiplying by it is
+/// bit-identical to dividing by `32768.0` (which the compiler already lowers
+/// to the same multiply).
+const S16_SCALE: f32 = 1.0 / 32768.0;
+
 /// Decode raw s16le PCM (or a canonical-WAV-wrapped clip) into mono f32 samples.
 ///
 /// Bazarr posts s16le / mono / 16 kHz PCM (`encode=false`); whisper-rs's
@@ -21,8 +27,9 @@ const WAV_HEADER_LEN: usize = 44;
 /// *output*, never to the sample decode feeding it).
 ///
 /// Each little-endian `i16` is divided by `32768.0` — the standard s16→float
-/// scale (`i16::MIN / 32768 == -1.0`, `i16::MAX / 32768 == 32767/32768`). A
-/// trailing odd byte (an incomplete final sample) is dropped (`chunks_exact(2)`).
+/// scale (`i16::MIN / 32768 == -1.0`, `i16::MAX / 32768 == 32767/32768`),
+/// written as a multiply by [`S16_SCALE`] over fixed-size `[u8; 2]` chunks. A
+/// trailing odd byte (an incomplete final sample) is dropped.
 /// If `bytes` begins with `b"RIFF"` — a clip wrapped in a canonical WAV/RIFF
 /// container — the 44-byte header is skipped first.
 pub fn pcm_s16le_to_f32(bytes: &[u8]) -> Vec<f32> {
@@ -31,8 +38,10 @@ pub fn pcm_s16le_to_f32(bytes: &[u8]) -> Vec<f32> {
     } else {
         bytes
     };
-    pcm.chunks_exact(2)
-        .map(|s| f32::from(i16::from_le_bytes([s[0], s[1]])) / 32768.0)
+    let (samples, _odd) = pcm.as_chunks::<2>();
+    samples
+        .iter()
+        .map(|&s| f32::from(i16::from_le_bytes(s)) * S16_SCALE)
         .collect()
 }
 
@@ -191,6 +200,17 @@ mod parity {
         );
     }
 
+    /// The reciprocal multiply is bit-identical to the `/32768.0` divide for
+    /// every `i16`.
+    #[test]
+    fn pcm_decode_scale_matches_divide_exhaustively() {
+        let bytes: Vec<u8> = (i16::MIN..=i16::MAX).flat_map(i16::to_le_bytes).collect();
+        let decoded = pcm_s16le_to_f32(&bytes);
+        for (sample, got) in (i16::MIN..=i16::MAX).zip(decoded) {
+            assert_eq!(got.to_bits(), (f32::from(sample) / 32768.0).to_bits());
+        }
+    }
+
     /// A trailing odd byte (incomplete final sample) is dropped, not padded.
     #[test]
     fn pcm_decode_drops_trailing_odd_byte() {
@@ -20,6 +20,7 @@ use std::io::IsTerminal;
 use std::path::{Path, PathBuf};
 
 use clap::{Args, Parser, Subcommand, ValueEnum};
+use futures::StreamExt;
 use submate_config::Config;
 use submate_media::{AudioSelector, AudioTrack};
 
@@ -405,6 +406,7 @@ fn cmd_translate(config_file: Option<&Path>, args: TranslateArgs) -> anyhow::Res
 
     let backend = build_backend(&config);
     let chunk_size = config.translation.chunk_size as usize;
+    let max_concurrent = config.translation.max_concurrent as usize;
 
     // The translation stack is async (the backends `.await` their reqwest
     // client); this standalone path has no ambient runtime, so drive each
@@ -454,6 +456,7 @@ fn cmd_translate(config_file: Option<&Path>, args: TranslateArgs) -> anyhow::Res
                         &source,
                         &args.target_lang,
                         chunk_size,
+                        max_concurrent,
                         &mut complete,
                     )
                     .await?;
@@ -464,6 +467,7 @@ fn cmd_translate(config_file: Option<&Path>, args: TranslateArgs) -> anyhow::Res
                     &source,
                     &args.target_lang,
                     chunk_size,
+                    max_concurrent,
                     &mut complete,
                 )
                 .await?),
@@ -472,6 +476,7 @@ fn cmd_translate(config_file: Option<&Path>, args: TranslateArgs) -> anyhow::Res
                     &source,
                     &args.target_lang,
                     chunk_size,
+                    max_concurrent,
                     &mut complete,
                 )
                 .await?),
@@ -528,6 +533,7 @@ fn assemble_options(s: &submate_config::StableTsSettings) -> submate_whisper::As
 /// transcribe path and the Bazarr server path. A translation error degrades to
 /// the untranslated content (`translate_content` absorbs it).
 #[cfg(feature = "model")]
+#[expect(clippy::too_many_arguments)]
 async fn render_subtitle(
     assembled: &submate_whisper::Transcription,
     format: submate_types::OutputFormat,
@@ -536,6 +542,7 @@ async fn render_subtitle(
     target_language: Option<&str>,
     backend: Option<&std::sync::Arc<Box<dyn submate_translate::Backend + Send + Sync>>>,
     chunk_size: usize,
+    max_concurrent: usize,
 ) -> String {
     let mut content = assembled.render(format, word_level);
     if let (Some(target), Some(backend)) = (target_language.filter(|t| !t.is_empty()), backend)
@@ -552,6 +559,7 @@ async fn render_subtitle(
             target,
             format,
             chunk_size,
+            max_concurrent,
             &mut complete,
         )
         .await;
@@ -606,17 +614,32 @@ fn find_subtitle_files(path: &Path, recursive: bool) -> Vec<PathBuf> {
 /// Walk `dir` (one level, or recursively), calling `visit` for each regular
 /// file. Errors reading a directory are swallowed, silently skipping unreadable
 /// entries.
+///
+/// Entry kinds come from [`std::fs::DirEntry::file_type`], which the directory
+/// listing already carries on most platforms (`d_type` on Linux), so a walk
+/// costs one `readdir` per directory rather than an extra `stat` per entry.
+/// Only symlinks are resolved with a `stat`, so links to files and directories
+/// are still followed.
 fn collect_files(dir: &Path, recursive: bool, visit: &mut dyn FnMut(&Path)) {
     let Ok(entries) = std::fs::read_dir(dir) else {
         return;
     };
     for entry in entries.flatten() {
+        let Ok(mut file_type) = entry.file_type() else {
+            continue;
+        };
         let path = entry.path();
-        if path.is_dir() {
+        if file_type.is_symlink() {
+            let Ok(meta) = std::fs::metadata(&path) else {
+                continue;
+            };
+            file_type = meta.file_type();
+        }
+        if file_type.is_dir() {
             if recursive {
                 collect_files(&path, recursive, visit);
             }
-        } else if path.is_file() {
+        } else if file_type.is_file() {
             visit(&path);
         }
     }
@@ -653,14 +676,17 @@ fn collect_media_files(path: &Path, recursive: bool) -> anyhow::Result<Vec<PathB
         submate_paths::is_video_file(&s) || submate_paths::is_audio_file(&s)
     };
 
-    if path.is_file() {
-        if is_media(path) {
-            return Ok(vec![path.to_path_buf()]);
+    // One `stat` decides file vs directory (rather than `is_file` then
+    // `is_dir`); the walk below classifies entries without any.
+    match std::fs::metadata(path) {
+        Ok(meta) if meta.is_file() => {
+            if is_media(path) {
+                return Ok(vec![path.to_path_buf()]);
+            }
+            anyhow::bail!("unsupported file type: {}", path.display());
         }
-        anyhow::bail!("unsupported file type: {}", path.display());
-    }
-    if !path.is_dir() {
-        anyhow::bail!("path does not exist: {}", path.display());
+        Ok(meta) if meta.is_dir() => {}
+        _ => anyhow::bail!("path does not exist: {}", path.display()),
     }
 
     let mut out = Vec::new();
@@ -748,8 +774,9 @@ async fn transcribe_files(
 
     // `--audio` is the typed selector; `--audio-language` is a hidden deprecated
     // alias that maps to `Lang(..)`. Prefer `--audio` when both are given. The
-    // selector flows to `prepare_audio_for_transcription` as a string; the
-    // whisper decode-language hint is resolved separately per file below.
+    // selector flows through `transcribe_one` to `prepare_audio_from_tracks` as
+    // a string; the whisper decode-language hint is resolved separately per file
+    // below.
     let mut selector: Option<AudioSelector> = match (&args.audio, &args.audio_language) {
         (Some(sel), _) => Some(sel.clone()),
         (None, Some(lang)) => {
@@ -763,15 +790,15 @@ async fn transcribe_files(
     // Interactive track picker — single file only. Multi-file / recursive runs
     // always take the deterministic rule (we never block a batch on a prompt),
     // and the prompt is further gated on stderr being a TTY. Resolving here pins
-    // the chosen track via a `track:<n>` selector.
+    // the chosen track via a `track:<n>` selector. The probe is kept for that
+    // file's pass through the loop below.
+    let mut probed: Option<Vec<AudioTrack>> = None;
     if files.len() == 1 {
         let file = &files[0];
-        let tracks = submate_media::get_audio_tracks(file)
-            .await
-            .unwrap_or_default();
+        let tracks = probed.insert(probe_tracks(file).await);
         let is_tty = std::io::stderr().is_terminal();
         match resolve_single_file_track(
-            &tracks,
+            tracks,
             selector.as_ref(),
             file,
             is_tty,
@@ -786,75 +813,91 @@ async fn transcribe_files(
         }
     }
 
-    let mut failed = 0usize;
-    for file in files {
-        // The decode-language hint is independent of track selection: an
-        // explicit `--language` wins; otherwise it defaults to the selected
-        // track's language tag (a probe failure degrades to auto-detect).
-        let decode_language = if args.language.is_some() {
-            submate_media::resolve_decode_language(&[], selector.as_ref(), args.language.as_deref())
-        } else {
-            let tracks = submate_media::get_audio_tracks(file)
-                .await
-                .unwrap_or_default();
-            submate_media::resolve_decode_language(&tracks, selector.as_ref(), None)
-        };
-
-        // whisper always transcribes in the source language; `--translate-to`
-        // is an LLM step applied to the rendered subtitle below.
-        let options = submate_whisper::TranscribeOptions {
-            language: decode_language,
-            task: submate_whisper::Task::Transcribe,
-            // CLI flags override the `SUBMATE__WHISPER__*` config defaults.
-            initial_prompt: args
-                .initial_prompt
-                .clone()
-                .or_else(|| config.whisper.initial_prompt.clone()),
-            beam_size: args.beam_size.or(config.whisper.beam_size),
-            temperature: args.temperature.or(config.whisper.temperature),
-            no_speech_threshold: args
-                .no_speech_threshold
-                .or(config.whisper.no_speech_threshold),
-            entropy_threshold: args.entropy_threshold.or(config.whisper.entropy_threshold),
-            logprob_threshold: args.logprob_threshold.or(config.whisper.logprob_threshold),
-            max_len: args.max_len.or(config.whisper.max_len),
-        };
-
-        let result = transcribe_one(
-            &dispatcher,
-            &model_path,
-            file,
-            selector_str.as_deref(),
-            options,
-            args.format,
-            args.translate_to.as_deref(),
-            backend.clone(),
-            config.translation.chunk_size,
-            &assemble,
-            config.stable_ts.word_level_highlight,
-        )
-        .await;
+    // Up to `runners` files are in flight at once (see `process_in_order`), so
+    // one file's probe/extraction overlaps another's inference and a batch
+    // actually uses every runner the Dispatcher allows.
+    let (dispatcher, model_path, assemble) = (&dispatcher, &model_path, &assemble);
+    let (selector, selector_str, backend) = (&selector, &selector_str, &backend);
+    let failed = process_in_order(
+        files,
+        dispatcher.runners(),
+        args.fail_fast,
+        |file| {
+            let probed = probed.take();
+            async move {
+                // One ffprobe per file, shared by the decode-language hint and the
+                // track extraction in `transcribe_one`.
+                let tracks = match probed {
+                    Some(tracks) => tracks,
+                    None => probe_tracks(file).await,
+                };
+
+                // The decode-language hint is independent of track selection: an
+                // explicit `--language` wins; otherwise it defaults to the selected
+                // track's language tag (a probe failure degrades to auto-detect).
+                let decode_language = submate_media::resolve_decode_language(
+                    &tracks,
+                    selector.as_ref(),
+                    args.language.as_deref(),
+                );
 
-        match result {
-            Ok(content) => {
-                // A plain transcribe targets `movie.<ext>`; when translating, the
-                // output is language-suffixed so it never overwrites the source.
-                let out_path =
-                    transcribe_output_path(file, args.format, args.translate_to.as_deref());
-                let (count, noun) = output_count(&content, args.format);
-                std::fs::write(&out_path, &content)
-                    .map_err(|e| anyhow::anyhow!("failed to write {}: {e}", out_path.display()))?;
-                println!("{}", result_summary(file, &out_path, count, noun));
+                // whisper always transcribes in the source language; `--translate-to`
+                // is an LLM step applied to the rendered subtitle below.
+                let options = submate_whisper::TranscribeOptions {
+                    language: decode_language,
+                    task: submate_whisper::Task::Transcribe,
+                    // CLI flags override the `SUBMATE__WHISPER__*` config defaults.
+                    initial_prompt: args
+                        .initial_prompt
+                        .clone()
+                        .or_else(|| config.whisper.initial_prompt.clone()),
+                    beam_size: args.beam_size.or(config.whisper.beam_size),
+                    temperature: args.temperature.or(config.whisper.temperature),
+                    no_speech_threshold: args
+                        .no_speech_threshold
+                        .or(config.whisper.no_speech_threshold),
+                    entropy_threshold: args.entropy_threshold.or(config.whisper.entropy_threshold),
+                    logprob_threshold: args.logprob_threshold.or(config.whisper.logprob_threshold),
+                    max_len: args.max_len.or(config.whisper.max_len),
+                };
+
+                transcribe_one(
+                    dispatcher,
+                    model_path,
+                    file,
+                    &tracks,
+                    selector_str.as_deref(),
+                    options,
+                    args.format,
+                    args.translate_to.as_deref(),
+                    backend.clone(),
+                    config.translation.chunk_size,
+                    config.translation.max_concurrent,
+                    assemble,
+                    config.stable_ts.word_level_highlight,
+                )
+                .await
             }
-            Err(e) => {
-                failed += 1;
-                println!("  Failed: {} ({e})", file.display());
-                if args.fail_fast {
-                    break;
+        },
+        |file, result| {
+            match result {
+                Ok(content) => {
+                    // A plain transcribe targets `movie.<ext>`; when translating, the
+                    // output is language-suffixed so it never overwrites the source.
+                    let out_path =
+                        transcribe_output_path(file, args.format, args.translate_to.as_deref());
+                    let (count, noun) = output_count(&content, args.format);
+                    std::fs::write(&out_path, &content).map_err(|e| {
+                        anyhow::anyhow!("failed to write {}: {e}", out_path.display())
+                    })?;
+                    println!("{}", result_summary(file, &out_path, count, noun));
                 }
+                Err(e) => println!("  Failed: {} ({e})", file.display()),
             }
-        }
-    }
+            Ok(())
+        },
+    )
+    .await?;
 
     if failed > 0 {
         anyhow::bail!("{failed} file(s) failed to process");
@@ -862,6 +905,61 @@ async fn transcribe_files(
     Ok(())
 }
 
+/// Run `process` over `files` with up to `concurrency` of them in flight,
+/// handing each result to `report` in input order. Returns how many failed.
+///
+/// Files are admitted lazily as slots free up, so a later file's work overlaps
+/// an earlier one's. With `fail_fast`, the first failure stops admitting new
+/// files, but the ones already in flight are still awaited and reported:
+/// whisper runs inside `spawn_blocking`, which can't be cancelled, so dropping
+/// them would only throw away finished work. An `Err` from `report` (a failed
+/// write) aborts the run immediately.
+async fn process_in_order<'a, T, Fut>(
+    files: &'a [PathBuf],
+    concurrency: usize,
+    fail_fast: bool,
+    mut process: impl FnMut(&'a Path) -> Fut,
+    mut report: impl FnMut(&'a Path, anyhow::Result<T>) -> anyhow::Result<()>,
+) -> anyhow::Result<usize>
+where
+    Fut: Future<Output = anyhow::Result<T>>,
+{
+    let stop = std::cell::Cell::new(false);
+    let jobs = files.iter().take_while(|_| !stop.get()).map(|file| {
+        let job = process(file);
+        async move { (file.as_path(), job.await) }
+    });
+    let mut results = futures::stream::iter(jobs).buffered(concurrency.max(1));
+
+    let mut failed = 0usize;
+    while let Some((file, result)) = results.next().await {
+        if result.is_err() {
+            failed += 1;
+            if fail_fast {
+                stop.set(true);
+            }
+        }
+        report(file, result)?;
+    }
+    Ok(failed)
+}
+
+/// Probe `file`'s audio tracks for [`transcribe_files`]. A probe failure is
+/// logged and yields no tracks, which every consumer treats as nothing to
+/// choose: no picker, an auto-detected language, whisper on the whole file.
+async fn probe_tracks(file: &Path) -> Vec<AudioTrack> {
+    submate_media::get_audio_tracks(file)
+        .await
+        .unwrap_or_else(|e| {
+            tracing::warn!(
+                path = %file.display(),
+                error = %e,
+                "failed to detect audio tracks, falling back to direct path",
+            );
+            Vec::new()
+        })
+}
+
 /// Transcribe one media file in-process: extract the selected track's PCM,
 /// run whisper under the dispatcher's runner cap, assemble the subtitle, and
 /// LLM-translate it when `translate_to` differs from the detected language.
@@ -871,22 +969,23 @@ async fn transcribe_one(
     dispatcher: &submate_whisper::Dispatcher,
     model_path: &Path,
     file: &Path,
+    tracks: &[AudioTrack],
     selector: Option<&str>,
     options: submate_whisper::TranscribeOptions,
     format: OutputFormat,
     translate_to: Option<&str>,
     backend: Option<std::sync::Arc<Box<dyn submate_translate::Backend + Send + Sync>>>,
     chunk_size: u32,
+    max_concurrent: u32,
     assemble: &submate_whisper::AssembleOptions,
     word_level: bool,
 ) -> anyhow::Result<String> {
-    use submate_media::{
-        PreparedAudio, extract_audio_track_to_memory, prepare_audio_for_transcription,
-    };
+    use submate_media::{PreparedAudio, extract_audio_track_to_memory, prepare_audio_from_tracks};
 
     // Extract the selected audio track to mono 16 kHz f32 PCM. The samples are
     // shared (Arc) with the assembly stage rather than deep-copied.
-    let pcm: std::sync::Arc<[f32]> = match prepare_audio_for_transcription(file, selector).await {
+    let prepared = prepare_audio_from_tracks(file, tracks, selector).await;
+    let pcm: std::sync::Arc<[f32]> = match prepared {
         PreparedAudio::Pcm(bytes) => submate_bazarr::pcm_s16le_to_f32(&bytes),
         PreparedAudio::Path(path) => {
             let bytes = extract_audio_track_to_memory(&path, 0)
@@ -916,6 +1015,7 @@ async fn transcribe_one(
         translate_to,
         backend.as_ref(),
         chunk_size.max(1) as usize,
+        max_concurrent as usize,
     )
     .await)
 }
@@ -927,12 +1027,14 @@ async fn transcribe_one(
     _dispatcher: &submate_whisper::Dispatcher,
     _model_path: &Path,
     _file: &Path,
+    _tracks: &[AudioTrack],
     _selector: Option<&str>,
     _options: submate_whisper::TranscribeOptions,
     _format: OutputFormat,
     _translate_to: Option<&str>,
     _backend: Option<std::sync::Arc<Box<dyn submate_translate::Backend + Send + Sync>>>,
     _chunk_size: u32,
+    _max_concurrent: u32,
     _assemble: &submate_whisper::AssembleOptions,
     _word_level: bool,
 ) -> anyhow::Result<String> {
@@ -1042,6 +1144,7 @@ struct WhisperBazarrTranscriber {
     model_path: String,
     backend: std::sync::Arc<Box<dyn submate_translate::Backend + Send + Sync>>,
     chunk_size: usize,
+    max_concurrent: usize,
     /// Decode knobs from `SUBMATE__WHISPER__*`, applied to every Bazarr request.
     /// `language`/`task` are placeholders overridden per call.
     decode: submate_whisper::TranscribeOptions,
@@ -1084,6 +1187,7 @@ impl submate_server::BazarrTranscriber for WhisperBazarrTranscriber {
             opts.target_language.as_deref(),
             Some(&self.backend),
             self.chunk_size,
+            self.max_concurrent,
         )
         .await;
 
@@ -1118,11 +1222,21 @@ fn build_bazarr_transcriber(
     dispatcher: submate_whisper::Dispatcher,
     config: &Config,
 ) -> anyhow::Result<Option<std::sync::Arc<dyn submate_server::BazarrTranscriber>>> {
+    // Load the model in the background while the server starts accepting
+    // requests, so the first Bazarr call doesn't pay the model load. A failure
+    // is only logged here; the request path reports it again.
+    let model_path = config.whisper.model.clone();
+    tokio::spawn(async move {
+        if let Err(e) = submate_whisper::preload_model(model_path).await {
+            tracing::warn!(error = %e, "failed to preload whisper model");
+        }
+    });
     Ok(Some(std::sync::Arc::new(WhisperBazarrTranscriber {
         dispatcher,
         model_path: config.whisper.model.clone(),
         backend: std::sync::Arc::new(build_backend(config)),
         chunk_size: config.translation.chunk_size.max(1) as usize,
+        max_concurrent: config.translation.max_concurrent as usize,
         decode: submate_whisper::TranscribeOptions {
             language: None,
             task: submate_whisper::Task::Transcribe,
@@ -2112,4 +2226,110 @@ mod cli {
             TrackDecision::Error(_)
         ));
     }
+
+    fn batch(names: &[&str]) -> Vec<PathBuf> {
+        names.iter().map(PathBuf::from).collect()
+    }
+
+    /// Files finishing out of order (later ones faster) are still reported in
+    /// input order, and every failure is counted without stopping the batch.
+    #[tokio::test]
+    async fn process_in_order_reports_in_input_order() {
+        let files = batch(&["a", "bad", "c", "d"]);
+        let mut reported = Vec::new();
+        let failed = process_in_order(
+            &files,
+            4,
+            false,
+            |file| async move {
+                let delay = match file.to_str() {
+                    Some("a") => 40,
+                    Some("bad") => 30,
+                    Some("c") => 20,
+                    _ => 10,
+                };
+                tokio::time::sleep(std::time::Duration::from_millis(delay)).await;
+                if file == Path::new("bad") {
+                    anyhow::bail!("boom");
+                }
+                Ok(file.display().to_string())
+            },
+            |file, result| {
+                reported.push((file.to_path_buf(), result.is_ok()));
+                Ok(())
+            },
+        )
+        .await
+        .unwrap();
+        assert_eq!(failed, 1);
+        assert_eq!(
+            reported,
+            vec![
+                (PathBuf::from("a"), true),
+                (PathBuf::from("bad"), false),
+                (PathBuf::from("c"), true),
+                (PathBuf::from("d"), true),
+            ]
+        );
+    }
+
+    /// `--fail-fast` stops admitting files after the first failure but still
+    /// drains (and reports) the ones already in flight.
+    #[tokio::test]
+    async fn process_in_order_fail_fast_drains_in_flight() {
+        let files = batch(&["a", "bad", "c", "d", "e"]);
+        let started = std::cell::RefCell::new(Vec::new());
+        let mut reported = Vec::new();
+        let failed = process_in_order(
+            &files,
+            2,
+            true,
+            |file| {
+                started.borrow_mut().push(file.to_path_buf());
+                async move {
+                    if file == Path::new("bad") {
+                        anyhow::bail!("boom");
+                    }
+                    Ok(())
+                }
+            },
+            |file, result| {
+                reported.push((file.to_path_buf(), result.is_ok()));
+                Ok(())
+            },
+        )
+        .await
+        .unwrap();
+        assert_eq!(failed, 1);
+        assert_eq!(*started.borrow(), batch(&["a", "bad", "c"]));
+        assert_eq!(
+            reported,
+            vec![
+                (PathBuf::from("a"), true),
+                (PathBuf::from("bad"), false),
+                (PathBuf::from("c"), true),
+            ]
+        );
+    }
+
+    /// A failed write (an `Err` from `report`) aborts the batch immediately.
+    #[tokio::test]
+    async fn process_in_order_report_error_aborts() {
+        let files = batch(&["a", "b"]);
+        let mut reported = 0;
+        let err = process_in_order(
+            &files,
+            1,
+            false,
+            |_| async { Ok(()) },
+            |file, _| {
+                reported += 1;
+                anyhow::bail!("failed to write {}", file.display())
+            },
+        )
+        .await
+        .unwrap_err();
+        assert_eq!(err.to_string(), "failed to write a");
+        assert_eq!(reported, 1);
+    }
 }
@@ -30,34 +30,44 @@ fn file_name(path: &Path) -> &str {
     path.file_name().and_then(|s| s.to_str()).unwrap_or("")
 }
 
-/// The `suffix` of the final component: the substring from the last `.` to the
-/// end, *including* the dot. Empty when the name has no interior dot — a leading
-/// dot (dotfile like `.srt`) does not count.
-fn suffix(path: &Path) -> String {
+/// Split the final component into `(stem, suffix)`, both borrowed from it.
+///
+/// The suffix is the substring from the last `.` to the end, *including* the
+/// dot; it is empty when the name has no interior dot — a leading dot (dotfile
+/// like `.srt`) does not count, so `.srt` is all stem. Slicing the name once
+/// keeps the hot per-file checks free of allocations.
+fn split_suffix(path: &Path) -> (&str, &str) {
     let name = file_name(path);
     match name.rfind('.') {
         // A dot at index 0 (dotfile, no stem) yields no suffix. Otherwise the
         // suffix runs from the dot to the end.
-        Some(idx) if idx > 0 => name[idx..].to_string(),
-        _ => String::new(),
+        Some(idx) if idx > 0 => name.split_at(idx),
+        _ => (name, ""),
     }
 }
 
+/// The `suffix` of the final component (see [`split_suffix`]).
+fn suffix(path: &Path) -> &str {
+    split_suffix(path).1
+}
+
 /// The `stem` of the final component: the name with its [`suffix`] removed. For
 /// `.srt` (suffixless dotfile) the stem is the whole name.
-fn stem(path: &Path) -> String {
-    let name = file_name(path);
-    let suf = suffix(path);
-    name[..name.len() - suf.len()].to_string()
+fn stem(path: &Path) -> &str {
+    split_suffix(path).0
 }
 
 /// `path.suffix.lower() in SUBTITLE_EXTENSIONS`.
 ///
 /// `movie.SRT` matches (case-folded), `movie.tar.gz` does not (`.gz`), and a
 /// dotfile like `.srt` with no stem has an empty suffix and does not match.
+/// The extensions are ASCII, so an ASCII case-insensitive compare matches the
+/// lowercased membership test without building a lowercased copy.
 pub fn is_subtitle_file(path: &Path) -> bool {
-    let suf = suffix(path).to_lowercase();
-    SUBTITLE_EXTENSIONS.contains(&suf.as_str())
+    let suf = suffix(path);
+    SUBTITLE_EXTENSIONS
+        .iter()
+        .any(|ext| ext.eq_ignore_ascii_case(suf))
 }
 
 /// Resolve the source language for a subtitle file.
@@ -72,15 +82,14 @@ pub fn detect_source_language(file: &Path, source_lang: &str) -> String {
         return source_lang.to_string();
     }
 
-    let file_stem = stem(file);
-    if file_stem.contains('.') {
-        let candidate = file_stem.rsplit('.').next().unwrap_or("");
-        if LanguageCode::from_string(Some(candidate)) != LanguageCode::None {
-            return candidate.to_string();
+    // One right-to-left scan finds the last interior dot and yields the
+    // candidate tag directly, instead of a `contains` pass plus a split.
+    match stem(file).rsplit_once('.') {
+        Some((_, candidate)) if LanguageCode::is_valid_language(Some(candidate)) => {
+            candidate.to_string()
         }
+        _ => "en".to_string(),
     }
-
-    "en".to_string()
 }
 
 /// Derive the default output path for a translated subtitle.
@@ -97,10 +106,9 @@ pub fn detect_source_language(file: &Path, source_lang: &str) -> String {
 /// is trivial IO handled by the caller.
 pub fn output_path(file: &Path, target_lang: &str) -> PathBuf {
     let file_stem = stem(file);
-    let base = match file_stem.rsplit_once('.') {
-        Some((head, _)) => head.to_string(),
-        None => file_stem,
-    };
+    let base = file_stem
+        .rsplit_once('.')
+        .map_or(file_stem, |(head, _)| head);
 
     let new_name = format!("{base}.{target_lang}{}", suffix(file));
     match file.parent() {
@@ -162,6 +162,11 @@ pub struct TranslationSettings {
     pub gemini_api_key: String,
     pub gemini_model: String,
     pub chunk_size: u32,
+    /// How many chunk requests of one document may be in flight at once.
+    /// Defaults to `1` (sequential): the default backend is a local Ollama,
+    /// which queues what it can't run in parallel, and the queue time counts
+    /// against each request's timeout.
+    pub max_concurrent: u32,
 }
 
 impl Default for TranslationSettings {
@@ -178,6 +183,7 @@ impl Default for TranslationSettings {
             gemini_api_key: String::new(),
             gemini_model: "gemini-2.5-flash".to_string(),
             chunk_size: 50,
+            max_concurrent: 1,
         }
     }
 }
@@ -235,6 +241,10 @@ impl Config {
     }
 }
 
+/// Regroup values that disable regrouping, matched ASCII-case-insensitively so
+/// the check never allocates a lowercased copy of the pattern.
+const REGROUP_OFF: [&str; 5] = ["false", "off", "0", "no", ""];
+
 /// Coerce a regroup env value into a [`StrOrBool`], or pass through an
 /// already-typed bool/string.
 ///
@@ -248,7 +258,7 @@ where
     match Value::deserialize(deserializer)? {
         Value::Bool(b) => Ok(StrOrBool::Bool(b)),
         Value::String(s) => {
-            if matches!(s.to_lowercase().as_str(), "false" | "off" | "0" | "no" | "") {
+            if REGROUP_OFF.iter().any(|off| s.eq_ignore_ascii_case(off)) {
                 Ok(StrOrBool::Bool(false))
             } else {
                 Ok(StrOrBool::Str(s))
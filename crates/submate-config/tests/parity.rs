@@ -12,12 +12,14 @@
 //!   field coercions: pipe-separated lists split on `'|'`, the whisper decode
 //!   knobs (`beam_size` → `u32`, `initial_prompt` → `String`), and the
 //!   `custom_regroup` string passthrough (a non-disabling pattern stays a string).
+//! * `parity::regroup_off` — the disabling `custom_regroup` spellings resolve to
+//!   `false` regardless of ASCII case.
 //!
 //! Object key ordering is irrelevant: both sides are compared as
 //! `serde_json::Value` (BTreeMap-backed).
 
 use fixtures::{EnvGuard, assert_json_eq, fixture_path, golden};
-use submate_config::Config;
+use submate_config::{Config, StrOrBool};
 
 #[test]
 fn defaults() {
@@ -73,3 +75,16 @@ fn validators() {
     let expected = golden("config/validators.resolved.json");
     assert_json_eq(&actual, &expected);
 }
+
+#[test]
+fn regroup_off() {
+    for value in ["OFF", "No", "fAlSe"] {
+        let _env = EnvGuard::set(&[("SUBMATE__STABLE_TS__CUSTOM_REGROUP", value)]);
+        let cfg = Config::from_env(None).expect("env resolves into Config");
+        assert_eq!(
+            cfg.stable_ts.custom_regroup,
+            StrOrBool::Bool(false),
+            "{value:?} disables regrouping"
+        );
+    }
+}
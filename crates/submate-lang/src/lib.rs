@@ -9,6 +9,10 @@
 //! crate: those crates carry their own (differing) data, and the downstream
 //! subtitle/path/config code requires exact parity with this table.
 
+use std::borrow::Cow;
+use std::collections::HashMap;
+use std::sync::OnceLock;
+
 /// Comprehensive language code enum with ISO 639-1, ISO 639-2/T and ISO 639-2/B
 /// support, plus English and native names.
 ///
@@ -138,9 +142,10 @@ struct LangEntry {
 
 /// The full language table, in definition order.
 ///
-/// Lookups iterate this slice front-to-back and return the first match, so the
-/// order is significant. [`LanguageCode::None`] is intentionally excluded here;
-/// it is the fallback returned when nothing matches.
+/// Lookups return the first matching row, so the order is significant, and it
+/// must also follow the enum's declaration order (see `LanguageCode::entry`).
+/// [`LanguageCode::None`] is intentionally excluded here; it is the fallback
+/// returned when nothing matches.
 #[rustfmt::skip]
 const TABLE: &[LangEntry] = &[
     LangEntry { variant: LanguageCode::AFAR, iso_639_1: Some("aa"), iso_639_2_t: Some("aar"), iso_639_2_b: Some("aar"), name_en: Some("Afar"), name_native: Some("Afar") },
@@ -253,8 +258,12 @@ impl LanguageCode {
         TABLE.iter().map(|e| e.variant)
     }
 
+    /// The table row for this variant.
+    ///
+    /// Variants are declared in table order, so the discriminant is the row
+    /// index; [`LanguageCode::None`] is declared last and falls off the end.
     fn entry(self) -> Option<&'static LangEntry> {
-        TABLE.iter().find(|e| e.variant == self)
+        TABLE.get(self as usize)
     }
 
     /// ISO 639-1 code (e.g. `"en"`), or `None`.
@@ -294,10 +303,11 @@ impl LanguageCode {
         let Some(code) = normalize(code) else {
             return Self::None;
         };
-        TABLE
-            .iter()
-            .find(|e| e.iso_639_1 == Some(code.as_str()))
-            .map_or(Self::None, |e| e.variant)
+        index()
+            .iso_639_1
+            .get(code.as_ref())
+            .copied()
+            .unwrap_or(Self::None)
     }
 
     /// Look up by ISO 639-2 code, matching either the /T or /B form (e.g.
@@ -306,10 +316,11 @@ impl LanguageCode {
         let Some(code) = normalize(code) else {
             return Self::None;
         };
-        TABLE
-            .iter()
-            .find(|e| e.iso_639_2_t == Some(code.as_str()) || e.iso_639_2_b == Some(code.as_str()))
-            .map_or(Self::None, |e| e.variant)
+        index()
+            .iso_639_2
+            .get(code.as_ref())
+            .copied()
+            .unwrap_or(Self::None)
     }
 
     /// Look up by language name (English or native). Case-insensitive and
@@ -318,15 +329,11 @@ impl LanguageCode {
         let Some(name) = normalize(name) else {
             return Self::None;
         };
-        for e in TABLE {
-            if e.name_en.is_some_and(|n| n.to_lowercase() == name) {
-                return e.variant;
-            }
-            if e.name_native.is_some_and(|n| n.to_lowercase() == name) {
-                return e.variant;
-            }
-        }
-        Self::None
+        index()
+            .name
+            .get(name.as_ref())
+            .copied()
+            .unwrap_or(Self::None)
     }
 
     /// Flexible parse: matches an ISO 639-1, 639-2/T, or 639-2/B code, an
@@ -339,18 +346,11 @@ impl LanguageCode {
         if value == "und" {
             return Self::None;
         }
-        let v = value.as_str();
-        for e in TABLE {
-            if e.iso_639_1 == Some(v)
-                || e.iso_639_2_t == Some(v)
-                || e.iso_639_2_b == Some(v)
-                || e.name_en.is_some_and(|n| n.to_lowercase() == value)
-                || e.name_native.is_some_and(|n| n.to_lowercase() == value)
-            {
-                return e.variant;
-            }
-        }
-        Self::None
+        index()
+            .any
+            .get(value.as_ref())
+            .copied()
+            .unwrap_or(Self::None)
     }
 
     /// Whether a string represents a valid (non-`None`) language.
@@ -359,8 +359,12 @@ impl LanguageCode {
     }
 
     /// True unless this is [`LanguageCode::None`].
+    ///
+    /// A plain variant comparison: every table entry carries an ISO 639-1
+    /// code, so this agrees with `to_iso_639_1().is_some()` without walking the
+    /// table to fetch a row only to test that it exists.
     pub fn is_some(self) -> bool {
-        self.to_iso_639_1().is_some()
+        self != Self::None
     }
 
     /// The English name, or `"Unknown"`.
@@ -375,17 +379,64 @@ impl std::fmt::Display for LanguageCode {
     }
 }
 
+/// Lowercased lookup keys -> variant, one map per `from_*` constructor.
+struct Index {
+    /// ISO 639-1 codes ([`LanguageCode::from_iso_639_1`]).
+    iso_639_1: HashMap<&'static str, LanguageCode>,
+    /// ISO 639-2/T and /B codes ([`LanguageCode::from_iso_639_2`]).
+    iso_639_2: HashMap<&'static str, LanguageCode>,
+    /// English and native names ([`LanguageCode::from_name`]).
+    name: HashMap<String, LanguageCode>,
+    /// Every code and name ([`LanguageCode::from_string`]).
+    any: HashMap<String, LanguageCode>,
+}
+
+/// The lookup maps, built from [`TABLE`] on first use.
+///
+/// Rows are inserted front-to-back without overwriting, so a key shared by
+/// several rows resolves to the first one, exactly as a table scan would.
+fn index() -> &'static Index {
+    static INDEX: OnceLock<Index> = OnceLock::new();
+    INDEX.get_or_init(|| {
+        let mut index = Index {
+            iso_639_1: HashMap::with_capacity(TABLE.len()),
+            iso_639_2: HashMap::with_capacity(2 * TABLE.len()),
+            name: HashMap::with_capacity(2 * TABLE.len()),
+            any: HashMap::with_capacity(5 * TABLE.len()),
+        };
+        for e in TABLE {
+            let codes = [e.iso_639_2_t, e.iso_639_2_b];
+            let names = [e.name_en, e.name_native].map(|n| n.map(str::to_lowercase));
+            if let Some(code) = e.iso_639_1 {
+                index.iso_639_1.entry(code).or_insert(e.variant);
+                index.any.entry(code.to_string()).or_insert(e.variant);
+            }
+            for code in codes.into_iter().flatten() {
+                index.iso_639_2.entry(code).or_insert(e.variant);
+                index.any.entry(code.to_string()).or_insert(e.variant);
+            }
+            for name in names.into_iter().flatten() {
+                index.name.entry(name.clone()).or_insert(e.variant);
+                index.any.entry(name).or_insert(e.variant);
+            }
+        }
+        index
+    })
+}
+
 /// Lowercase + trim, returning `None` for empty/absent input.
-fn normalize(s: Option<&str>) -> Option<String> {
-    let s = s?;
+///
+/// Input that is already trimmed-to and lowercase ASCII (the usual `"en"`,
+/// `"eng"`, `"english"` tokens) is borrowed; only other input pays for a
+/// lowercased copy.
+fn normalize(s: Option<&str>) -> Option<Cow<'_, str>> {
+    let s = s?.trim();
     if s.is_empty() {
-        return None;
-    }
-    let normalized = s.trim().to_lowercase();
-    if normalized.is_empty() {
         None
+    } else if s.is_ascii() && !s.bytes().any(|b| b.is_ascii_uppercase()) {
+        Some(Cow::Borrowed(s))
     } else {
-        Some(normalized)
+        Some(Cow::Owned(s.to_lowercase()))
     }
 }
 
@@ -398,6 +449,74 @@ mod tests {
         assert_eq!(TABLE.len(), 101);
     }
 
+    #[test]
+    fn discriminant_is_table_index() {
+        for (i, e) in TABLE.iter().enumerate() {
+            assert_eq!(e.variant as usize, i, "{:?}", e.variant);
+        }
+        assert_eq!(LanguageCode::None as usize, TABLE.len());
+    }
+
+    /// The indexed `from_*` lookups agree with a first-match table scan for
+    /// every code and name in the table.
+    #[test]
+    fn index_matches_first_row_scan() {
+        let scan = |hit: &dyn Fn(&LangEntry) -> bool| {
+            TABLE
+                .iter()
+                .find(|e| hit(e))
+                .map_or(LanguageCode::None, |e| e.variant)
+        };
+        let keys = TABLE.iter().flat_map(|e| {
+            [
+                e.iso_639_1,
+                e.iso_639_2_t,
+                e.iso_639_2_b,
+                e.name_en,
+                e.name_native,
+            ]
+            .into_iter()
+            .flatten()
+            .map(str::to_lowercase)
+        });
+        for key in keys {
+            let k = Some(key.as_str());
+            let name = |n: Option<&str>| n.is_some_and(|n| n.to_lowercase() == key);
+            assert_eq!(LanguageCode::from_iso_639_1(k), scan(&|e| e.iso_639_1 == k));
+            assert_eq!(
+                LanguageCode::from_iso_639_2(k),
+                scan(&|e| e.iso_639_2_t == k || e.iso_639_2_b == k)
+            );
+            assert_eq!(
+                LanguageCode::from_name(k),
+                scan(&|e| name(e.name_en) || name(e.name_native))
+            );
+            assert_eq!(
+                LanguageCode::from_string(k),
+                scan(&|e| {
+                    e.iso_639_1 == k
+                        || e.iso_639_2_t == k
+                        || e.iso_639_2_b == k
+                        || name(e.name_en)
+                        || name(e.name_native)
+                })
+            );
+        }
+    }
+
+    #[test]
+    fn normalize_borrows_already_normalized_input() {
+        assert!(matches!(normalize(Some("en")), Some(Cow::Borrowed("en"))));
+        assert!(matches!(
+            normalize(Some(" eng\n")),
+            Some(Cow::Borrowed("eng"))
+        ));
+        assert_eq!(normalize(Some(" EN ")).as_deref(), Some("en"));
+        assert_eq!(normalize(Some("Čeština")).as_deref(), Some("čeština"));
+        assert_eq!(normalize(Some("  ")), None);
+        assert_eq!(normalize(None), None);
+    }
+
     #[test]
     fn iso_639_2_b_divergences() {
         assert_eq!(LanguageCode::TIBETAN.to_iso_639_2_t(), Some("bod"));
@@ -406,6 +525,15 @@ mod tests {
         assert_eq!(LanguageCode::CZECH.to_iso_639_2_b(), Some("cze"));
     }
 
+    #[test]
+    fn is_some_matches_iso_639_1_presence() {
+        for code in LanguageCode::all() {
+            assert!(code.is_some(), "{code:?}");
+            assert!(code.to_iso_639_1().is_some(), "{code:?}");
+        }
+        assert!(LanguageCode::None.to_iso_639_1().is_none());
+    }
+
     #[test]
     fn round_trips_and_none() {
         assert_eq!(
@@ -1,8 +1,8 @@
 //! ffmpeg/ffprobe wrappers.
 //!
-//! Covers audio-track probing — [`get_audio_tracks`] runs
-//! `ffprobe -show_streams -select_streams a -of json` and reads each audio
-//! stream's index, language tag and codec name — and audio extraction:
+//! Covers audio-track probing — [`get_audio_tracks`] runs `ffprobe` over the
+//! audio streams (JSON output) and reads each audio stream's index, language
+//! tag and codec name — and audio extraction:
 //! [`extract_audio_track_to_memory`] and [`prepare_audio_for_transcription`]
 //! spawn `ffmpeg` to decode a selected audio track to raw 16-bit mono 16 kHz
 //! PCM in memory.
@@ -95,8 +95,9 @@ struct StreamTags {
     title: Option<String>,
 }
 
-/// Parse the JSON payload produced by
-/// `ffprobe -show_streams -select_streams a -of json` into [`AudioTrack`]s.
+/// Parse the JSON payload produced by the [`get_audio_tracks`] ffprobe call (or
+/// a full `ffprobe -show_streams -select_streams a -of json`) into
+/// [`AudioTrack`]s.
 ///
 /// Split out from [`get_audio_tracks`] so the parsing logic is testable
 /// without invoking the `ffprobe` binary. The `index` of each returned track
@@ -353,15 +354,25 @@ pub fn resolve_decode_language(
     }
 }
 
+/// The ffprobe stream entries [`parse_audio_tracks`] reads.
+///
+/// `-show_streams` prints every field of every stream (bit rates, frame
+/// counts, the full tag set, ...), most of which the parser would skip over.
+/// Asking for just these keeps the JSON to a few lines per stream; the output
+/// shape is the same, so the parser handles either form.
+const PROBE_ENTRIES: &str =
+    "stream=codec_name:stream_disposition=default:stream_tags=language,title";
+
 /// Extract audio-track information from a media file via `ffprobe`.
 ///
-/// Runs `ffprobe -show_streams -select_streams a -of json <path>` and parses
-/// the result. Returns a [`ProbeError`] if `ffprobe` cannot be run, exits
+/// Runs `ffprobe -show_entries <PROBE_ENTRIES> -select_streams a -of json
+/// <path>` and parses the result. Returns a [`ProbeError`] if `ffprobe` cannot be run, exits
 /// non-zero, or emits unparseable output.
 #[tracing::instrument(skip_all, fields(video = %video_path.display()))]
 pub async fn get_audio_tracks(video_path: &Path) -> Result<Vec<AudioTrack>, ProbeError> {
     let output = tokio::process::Command::new("ffprobe")
-        .args(["-show_streams", "-select_streams", "a", "-of", "json"])
+        .args(["-show_entries", PROBE_ENTRIES])
+        .args(["-select_streams", "a", "-of", "json"])
         .arg(video_path)
         .output()
         .await
@@ -470,8 +481,6 @@ pub async fn prepare_audio_for_transcription(
     file_path: &Path,
     selector: Option<&str>,
 ) -> PreparedAudio {
-    let fallback = || PreparedAudio::Path(file_path.to_path_buf());
-
     let tracks = match get_audio_tracks(file_path).await {
         Ok(tracks) => tracks,
         Err(err) => {
@@ -480,9 +489,22 @@ pub async fn prepare_audio_for_transcription(
                 error = %err,
                 "failed to detect audio tracks, falling back to direct path",
             );
-            return fallback();
+            return PreparedAudio::Path(file_path.to_path_buf());
         }
     };
+    prepare_audio_from_tracks(file_path, &tracks, selector).await
+}
+
+/// [`prepare_audio_for_transcription`] for a caller that already probed the
+/// file: `tracks` is the [`get_audio_tracks`] result, so `ffprobe` is not run
+/// again. An empty slice (e.g. a failed probe) takes the direct-path branch.
+#[tracing::instrument(skip_all, fields(file = %file_path.display(), selector = selector.unwrap_or("auto")))]
+pub async fn prepare_audio_from_tracks(
+    file_path: &Path,
+    tracks: &[AudioTrack],
+    selector: Option<&str>,
+) -> PreparedAudio {
+    let fallback = || PreparedAudio::Path(file_path.to_path_buf());
 
     // At most one track: nothing to disambiguate, hand whisper the file.
     if tracks.len() <= 1 {
@@ -506,7 +528,7 @@ pub async fn prepare_audio_for_transcription(
         })
         .unwrap_or(AudioSelector::Auto);
 
-    let index = match resolve_audio_selector(&tracks, &selector) {
+    let index = match resolve_audio_selector(tracks, &selector) {
         Ok(index) => index,
         Err(err) => {
             tracing::warn!(
@@ -518,7 +540,7 @@ pub async fn prepare_audio_for_transcription(
         }
     };
 
-    if lang_match_is_ambiguous(&tracks, &selector) {
+    if lang_match_is_ambiguous(tracks, &selector) {
         tracing::info!(
             path = %file_path.display(),
             selected = index,
@@ -649,6 +671,34 @@ mod parity {
         ));
     }
 
+    /// The trimmed `-show_entries` output (no `index`/`codec_type`, a sibling
+    /// `programs` key) parses the same as full `-show_streams` output.
+    #[test]
+    fn probe_parses_show_entries_output() {
+        let json = r#"{
+            "programs": [],
+            "streams": [
+                {
+                    "codec_name": "opus",
+                    "disposition": { "default": 1 },
+                    "tags": { "language": "ger" }
+                }
+            ]
+        }"#;
+        let tracks = parse_audio_tracks(json).expect("trimmed JSON parses");
+
+        assert_eq!(
+            tracks,
+            vec![AudioTrack {
+                index: 0,
+                language: "ger".to_string(),
+                codec: "opus".to_string(),
+                default: true,
+                title: None,
+            }],
+        );
+    }
+
     /// `disposition.default` and `tags.title` flow through to [`AudioTrack`]
     /// without disturbing the existing index/language/codec mapping.
     #[test]
@@ -1020,6 +1070,24 @@ mod extract {
         let prepared = prepare_audio_for_transcription(missing, None).await;
         assert_eq!(prepared, PreparedAudio::Path(missing.to_path_buf()));
     }
+
+    /// Pre-probed tracks with nothing to choose between go straight to the
+    /// direct path; neither `ffprobe` nor `ffmpeg` is run.
+    #[tokio::test]
+    async fn prepare_from_tracks_single_track_is_direct_path() {
+        let file = Path::new("/nonexistent/submate-media/one-track.mkv");
+        let tracks = [AudioTrack {
+            index: 0,
+            language: "eng".to_string(),
+            codec: "aac".to_string(),
+            default: true,
+            title: None,
+        }];
+        for tracks in [&tracks[..], &[]] {
+            let prepared = prepare_audio_from_tracks(file, tracks, Some("lang:en")).await;
+            assert_eq!(prepared, PreparedAudio::Path(file.to_path_buf()));
+        }
+    }
 }
 
 /// Extract `clipA`'s first audio track to PCM with the real `ffmpeg` and assert
@@ -28,13 +28,18 @@ pub fn is_audio_file(path: &str) -> bool {
 }
 
 fn has_extension(path: &str, extensions: &[&str]) -> bool {
-    // The final `.ext` of the last component, including its leading dot,
-    // lowercased.
-    let suffix = match Utf8Path::new(path).extension() {
-        Some(ext) => format!(".{}", ext.to_lowercase()),
-        None => return false,
+    // The final `ext` of the last component, compared against each
+    // dot-prefixed entry case-insensitively. The tables are ASCII, so an ASCII
+    // fold matches what lowercasing the extension would, without building a
+    // `.ext` string per call.
+    let Some(ext) = Utf8Path::new(path).extension() else {
+        return false;
     };
-    extensions.contains(&suffix.as_str())
+    extensions.iter().any(|known| {
+        known
+            .strip_prefix('.')
+            .is_some_and(|k| k.eq_ignore_ascii_case(ext))
+    })
 }
 
 #[cfg(test)]
@@ -49,5 +54,8 @@ mod tests {
         assert!(!is_video_file("noext"));
         assert!(is_audio_file("track.FLAC"));
         assert!(!is_audio_file("track.mp4"));
+        assert!(is_video_file("movie.MpEg"));
+        assert!(!is_video_file(".mkv"));
+        assert!(!is_video_file("movie.mkv.part"));
     }
 }
@@ -219,11 +219,16 @@ struct DetectParams {
 
 /// Read the `audio_file` multipart field (Bazarr's raw s16le PCM), or `None` if
 /// the part is absent or unreadable.
+///
+/// The upload is a whole episode's audio (tens to hundreds of MB), so the
+/// collected `Bytes` is converted with `Vec::from` rather than `to_vec`: when
+/// the buffer is uniquely owned — the usual case once the field is fully read —
+/// its allocation is reused instead of copied.
 #[cfg(feature = "bazarr")]
 async fn read_audio_file(mut multipart: Multipart) -> Option<Vec<u8>> {
     while let Ok(Some(field)) = multipart.next_field().await {
         if field.name() == Some("audio_file") {
-            return field.bytes().await.ok().map(|b| b.to_vec());
+            return field.bytes().await.ok().map(Vec::from);
         }
     }
     None
@@ -7,6 +7,9 @@
 //! Times are kept in whole milliseconds, which is the resolution both formats
 //! use and matches the goldens in `fixtures/subtitle/`.
 
+use std::borrow::Cow;
+use std::fmt::Write as _;
+
 /// A single subtitle cue: a time span plus its (possibly multi-line) text.
 ///
 /// `index` is the 1-based number from the source SRT block when present. VTT
@@ -37,17 +40,15 @@ fn ms_to_parts(ms: i64) -> (i64, i64, i64, i64) {
     (h, m, s, ms)
 }
 
-/// Format milliseconds as an SRT timestamp `HH:MM:SS,mmm`.
-fn format_srt_timestamp(ms: i64) -> String {
+/// Append `HH:MM:SS<millis_sep>mmm` to `out`: `,` for SRT, `.` for WebVTT.
+fn push_timestamp(out: &mut String, ms: i64, millis_sep: char) {
     let (h, m, s, ms) = ms_to_parts(ms);
-    format!("{h:02}:{m:02}:{s:02},{ms:03}")
+    write!(out, "{h:02}:{m:02}:{s:02}{millis_sep}{ms:03}").expect("writing to a String");
 }
 
-/// Format milliseconds as a WebVTT timestamp `HH:MM:SS.mmm`: the SRT formatter
-/// with the comma swapped for a dot.
-fn format_vtt_timestamp(ms: i64) -> String {
-    format_srt_timestamp(ms).replace(',', ".")
-}
+/// Rough per-cue size of the number and timing lines, used to presize the
+/// composed output so it is built in one buffer without regrowing.
+const CUE_HEADER_LEN: usize = 40;
 
 /// Parse an SRT-style `HH:MM:SS,mmm` (or VTT `HH:MM:SS.mmm`) timestamp into
 /// milliseconds. Hours are optional and may exceed two digits.
@@ -80,13 +81,13 @@ fn parse_timestamp(ts: &str) -> Option<i64> {
 /// Collapse runs of blank lines and strip leading/trailing blank lines from a
 /// cue body: a `\n\n+` run is replaced with a single `\n` after stripping
 /// leading/trailing `\n`.
-fn make_legal_content(content: &str) -> String {
-    // Fast path: already-legal content is returned unchanged.
+fn make_legal_content(content: &str) -> Cow<'_, str> {
+    // Fast path: already-legal content is borrowed unchanged.
     if !content.is_empty() && !content.starts_with('\n') && !content.contains("\n\n") {
-        return content.to_string();
+        return Cow::Borrowed(content);
     }
     let stripped = content.trim_matches('\n');
-    collapse_blank_lines(stripped)
+    Cow::Owned(collapse_blank_lines(stripped))
 }
 
 /// Replace every run of two-or-more `\n` with a single `\n` (`\n\n+` -> `\n`).
@@ -214,6 +215,11 @@ fn parse_arrow_line(line: &str) -> Option<(i64, i64)> {
     Some((parse_timestamp(start)?, parse_timestamp(end)?))
 }
 
+/// Capacity for composing `cues`: their text plus [`CUE_HEADER_LEN`] each.
+fn composed_len_hint(cues: &[Cue]) -> usize {
+    cues.iter().map(|c| c.text.len() + CUE_HEADER_LEN).sum()
+}
+
 /// Serialize cues to an SRT string with reindexing, strict skipping of
 /// non-useful cues, and `\n` line endings.
 pub fn compose_srt(cues: &[Cue]) -> String {
@@ -227,17 +233,16 @@ pub fn compose_srt(cues: &[Cue]) -> String {
             .then(a.text.cmp(&b.text))
     });
 
-    let mut out = String::new();
+    let mut out = String::with_capacity(composed_len_hint(cues));
     let mut number = 1u64;
     for cue in ordered {
         if srt_should_skip(cue) {
             continue;
         }
-        out.push_str(&number.to_string());
-        out.push('\n');
-        out.push_str(&format_srt_timestamp(cue.start_ms));
+        writeln!(out, "{number}").expect("writing to a String");
+        push_timestamp(&mut out, cue.start_ms, ',');
         out.push_str(" --> ");
-        out.push_str(&format_srt_timestamp(cue.end_ms));
+        push_timestamp(&mut out, cue.end_ms, ',');
         out.push('\n');
         out.push_str(&make_legal_content(&cue.text));
         out.push_str("\n\n");
@@ -399,18 +404,17 @@ pub fn compose_vtt(cues: &[Cue]) -> String {
     // Sort by start (stable).
     ordered.sort_by_key(|c| c.start_ms);
 
-    let mut out = String::from("WEBVTT\n\n");
+    let mut out = String::with_capacity(composed_len_hint(cues));
+    out.push_str("WEBVTT\n\n");
     for (n, cue) in ordered.iter().enumerate() {
         let lineno = n + 1;
-        out.push_str(&lineno.to_string());
-        out.push('\n');
-        out.push_str(&format_vtt_timestamp(cue.start_ms));
+        writeln!(out, "{lineno}").expect("writing to a String");
+        push_timestamp(&mut out, cue.start_ms, '.');
         out.push_str(" --> ");
-        out.push_str(&format_vtt_timestamp(cue.end_ms));
+        push_timestamp(&mut out, cue.end_ms, '.');
         out.push('\n');
         // Collapse `\n+` -> `\n`, then strip.
-        let text = collapse_blank_lines(cue.text.trim()).trim().to_string();
-        out.push_str(&text);
+        out.push_str(collapse_blank_lines(cue.text.trim()).trim());
         out.push_str("\n\n");
     }
     out
@@ -478,19 +482,33 @@ mod parity {
         assert!(checked > 0, "no .vtt goldens found in {}", dir.display());
     }
 
+    fn timestamp(ms: i64, millis_sep: char) -> String {
+        let mut out = String::new();
+        push_timestamp(&mut out, ms, millis_sep);
+        out
+    }
+
     #[test]
     fn srt_timestamp_format() {
-        assert_eq!(format_srt_timestamp(0), "00:00:00,000");
-        assert_eq!(format_srt_timestamp(5_500), "00:00:05,500");
-        assert_eq!(format_srt_timestamp(8_250), "00:00:08,250");
+        assert_eq!(timestamp(0, ','), "00:00:00,000");
+        assert_eq!(timestamp(5_500, ','), "00:00:05,500");
+        assert_eq!(timestamp(8_250, ','), "00:00:08,250");
         // 1h23m4s
-        assert_eq!(format_srt_timestamp(4_984_000), "01:23:04,000");
+        assert_eq!(timestamp(4_984_000, ','), "01:23:04,000");
     }
 
     #[test]
     fn vtt_timestamp_format() {
-        assert_eq!(format_vtt_timestamp(1_000), "00:00:01.000");
-        assert_eq!(format_vtt_timestamp(8_250), "00:00:08.250");
+        assert_eq!(timestamp(1_000, '.'), "00:00:01.000");
+        assert_eq!(timestamp(8_250, '.'), "00:00:08.250");
+    }
+
+    /// `push_timestamp` appends to the cue line being built.
+    #[test]
+    fn push_timestamp_appends() {
+        let mut line = String::from("00:00:01,000 --> ");
+        push_timestamp(&mut line, 2_500, ',');
+        assert_eq!(line, "00:00:01,000 --> 00:00:02,500");
     }
 
     #[test]
@@ -28,6 +28,7 @@ use async_openai::error::OpenAIError;
 use async_openai::types::chat::{
     ChatCompletionRequestUserMessageArgs, CreateChatCompletionRequestArgs,
 };
+use futures::{StreamExt, TryStreamExt};
 use serde::Serialize;
 
 /// Default chunked-translation prompt template.
@@ -50,10 +51,17 @@ pub const VTT_SEPARATOR_TOKEN: &str = "|||SUBTITLE_BREAK|||";
 /// so literal braces elsewhere in the template are left untouched (the
 /// templates contain none beyond the three placeholders).
 pub fn format_prompt(template: &str, source_lang: &str, target_lang: &str, text: &str) -> String {
+    fill_languages(template, source_lang, target_lang).replace("{text}", text)
+}
+
+/// The first stage of [`format_prompt`]: substitute only the language
+/// placeholders, leaving `{text}` in place. The chunked loop does this once per
+/// document and fills `{text}` per batch, rather than re-substituting the
+/// constant language pair into the (multi-KB) template for every chunk.
+fn fill_languages(template: &str, source_lang: &str, target_lang: &str) -> String {
     template
         .replace("{source_lang}", source_lang)
         .replace("{target_lang}", target_lang)
-        .replace("{text}", text)
 }
 
 /// A translation backend.
@@ -251,15 +259,27 @@ const CONNECT_TIMEOUT: Duration = Duration::from_secs(10);
 /// code set no timeout at all, so a single stuck call blocked the whole batch.
 const REQUEST_TIMEOUT: Duration = Duration::from_secs(300);
 
+/// TCP keep-alive idle time for pooled backend connections: how long a
+/// connection may sit idle before the first keep-alive probe is sent
+/// (`TCP_KEEPIDLE`). The interval between later probes is left to the OS.
+///
+/// A chunked translation leaves the connection idle while the model generates,
+/// and a long generation (or a pause between files) can outlast the idle
+/// timeout of a NAT or proxy in the path. Probing after a minute of silence
+/// keeps the pooled connection warm, so the next chunk reuses it instead of paying a fresh TCP + TLS
+/// handshake after a silently dropped socket.
+const TCP_KEEPALIVE: Duration = Duration::from_secs(60);
+
 /// Build the shared `reqwest::Client` for the LLM backends with connect/request
-/// timeouts. Constructed once per backend and reused across every chunk request
-/// (so connection pooling and TLS sessions are kept). A failure here means the
-/// system TLS stack is unusable — fatal, and surfaced once at construction
-/// rather than silently per request.
+/// timeouts and TCP keep-alive. Constructed once per backend and reused across
+/// every chunk request (so connection pooling and TLS sessions are kept). A
+/// failure here means the system TLS stack is unusable — fatal, and surfaced
+/// once at construction rather than silently per request.
 fn http_client() -> reqwest::Client {
     reqwest::Client::builder()
         .connect_timeout(CONNECT_TIMEOUT)
         .timeout(REQUEST_TIMEOUT)
+        .tcp_keepalive(TCP_KEEPALIVE)
         .build()
         .expect("reqwest client (system TLS backend) must initialize")
 }
@@ -394,7 +414,11 @@ struct ClaudeBlock {
 /// exponential backoff, but [`AnthropicBackend`] talks to the messages API with
 /// raw `reqwest`, so it carries its own policy. Retries cover transient failures
 /// — connection errors, HTTP 429, and 5xx — with exponential backoff plus jitter
-/// so concurrent workers don't resynchronize onto the same retry instant.
+/// so concurrent workers don't resynchronize onto the same retry instant. When
+/// the server says how long to back off (`Retry-After`), that wait replaces the
+/// computed backoff, so a rate-limited worker doesn't hammer the API before the
+/// window reopens; a little jitter is still added on top, since every batch
+/// that hit the same 429 gets the same header.
 #[derive(Clone, Copy)]
 struct RetryPolicy {
     /// Total attempts including the first try (so `1` disables retrying).
@@ -403,6 +427,11 @@ struct RetryPolicy {
     base_delay: Duration,
     /// Ceiling on a single backoff wait.
     max_delay: Duration,
+    /// Ceiling on a server-requested `Retry-After` wait, so a misbehaving or
+    /// hostile header can't park a worker indefinitely.
+    max_retry_after: Duration,
+    /// Upper bound on the random extra wait added after a `Retry-After`.
+    retry_after_jitter: Duration,
 }
 
 impl Default for RetryPolicy {
@@ -411,6 +440,8 @@ impl Default for RetryPolicy {
             max_attempts: 4,
             base_delay: Duration::from_millis(500),
             max_delay: Duration::from_secs(8),
+            max_retry_after: Duration::from_secs(60),
+            retry_after_jitter: Duration::from_secs(1),
         }
     }
 }
@@ -432,6 +463,34 @@ fn backoff_ceiling(attempt: u32, base: Duration, max: Duration) -> Duration {
     base.saturating_mul(factor).min(max)
 }
 
+/// The wait before retrying a request the server answered with a
+/// `Retry-After` of `requested`: the request capped at
+/// `policy.max_retry_after`, plus `spread` (in `[0, 1)`) of
+/// `policy.retry_after_jitter`.
+///
+/// The jitter only ever lengthens the wait, so the server's window is still
+/// honored, while concurrent calls rate-limited by the same 429 don't all
+/// retry at the same instant. `spread` is a parameter so this stays pure.
+fn retry_after_delay(requested: Duration, policy: &RetryPolicy, spread: f64) -> Duration {
+    requested.min(policy.max_retry_after) + policy.retry_after_jitter.mul_f64(spread)
+}
+
+/// The server-requested wait from a `Retry-After` header, if present.
+///
+/// Only the delta-seconds form is read — that is what the Anthropic API sends
+/// on 429/529. The HTTP-date form (or any unparsable value) yields `None`, and
+/// the caller falls back to its own exponential backoff.
+fn retry_after(headers: &reqwest::header::HeaderMap) -> Option<Duration> {
+    headers
+        .get(reqwest::header::RETRY_AFTER)?
+        .to_str()
+        .ok()?
+        .trim()
+        .parse::<u64>()
+        .ok()
+        .map(Duration::from_secs)
+}
+
 pub struct AnthropicBackend {
     api_key: String,
     model: String,
@@ -517,19 +576,32 @@ impl Backend for AnthropicBackend {
                 .send()
                 .await;
 
-            let retryable = match &outcome {
-                Ok(resp) => is_retryable_status(resp.status()),
+            let (retryable, requested) = match &outcome {
+                Ok(resp) => (
+                    is_retryable_status(resp.status()),
+                    retry_after(resp.headers()),
+                ),
                 // Only connection-level failures are safe to retry; a request
                 // timeout means the server may have received it, so leave it.
-                Err(err) => err.is_connect(),
+                Err(err) => (err.is_connect(), None),
             };
 
             if retryable && attempt + 1 < self.retry.max_attempts {
-                let ceiling = backoff_ceiling(attempt, self.retry.base_delay, self.retry.max_delay);
-                // Equal jitter: a random point in the upper half of the ceiling
-                // keeps a floor while spreading retries across concurrent calls.
-                let half = ceiling / 2;
-                let delay = half + half.mul_f64(fastrand::f64());
+                let delay = match requested {
+                    // The server named its own window: wait that long (capped,
+                    // plus jitter) rather than guessing and retrying into
+                    // another 429.
+                    Some(wait) => retry_after_delay(wait, &self.retry, fastrand::f64()),
+                    None => {
+                        let ceiling =
+                            backoff_ceiling(attempt, self.retry.base_delay, self.retry.max_delay);
+                        // Equal jitter: a random point in the upper half of the
+                        // ceiling keeps a floor while spreading retries across
+                        // concurrent calls.
+                        let half = ceiling / 2;
+                        half + half.mul_f64(fastrand::f64())
+                    }
+                };
                 tracing::warn!(
                     attempt = attempt + 1,
                     max_attempts = self.retry.max_attempts,
@@ -603,15 +675,14 @@ pub fn join_batch<S: AsRef<str>>(texts: &[S], separator_token: &str) -> String {
 /// originals for the whole batch rather than shifting translations onto the
 /// wrong cues. The returned vec always has length `originals.len()`.
 pub fn split_batch(translated: &str, separator_token: &str, originals: &[String]) -> Vec<String> {
-    let parts: Vec<String> = translated
-        .split(separator_token)
-        .map(|p| p.trim().to_string())
-        .collect();
+    // Split and trim as borrowed slices in one pass; only a reply whose block
+    // count lines up is copied into owned strings.
+    let parts: Vec<&str> = translated.split(separator_token).map(str::trim).collect();
 
     if parts.len() != originals.len() {
         return originals.to_vec();
     }
-    parts
+    parts.into_iter().map(str::to_string).collect()
 }
 
 /// ASS/SSA tag-preservation prompt.
@@ -621,74 +692,78 @@ pub fn split_batch(translated: &str, separator_token: &str, originals: &[String]
 /// leaving `{...}` override tags and `\N` / `\n` newline markers untouched.
 pub const ASS_TRANSLATION_PROMPT: &str = "Translate the following ASS subtitle dialogue from {source_lang} to {target_lang}.\n\nCRITICAL RULES:\n1. ONLY translate the human-readable dialogue text\n2. PRESERVE ALL formatting tags exactly as-is: {\\i1}, {\\b1}, {\\pos(x,y)}, {\\an8}, {\\fad(x,y)}, etc.\n3. PRESERVE newline markers: \\N and \\n\n4. PRESERVE the exact line structure (one subtitle per line, separated by |||SUBTITLE_BREAK|||)\n5. DO NOT add, remove, or modify any tags inside curly braces {}\n6. DO NOT translate or modify anything inside curly braces {}\n7. Output ONLY the translated subtitles, no explanations\n\nExample input:\n{\\i1}Bonjour{\\i0} monde\n|||SUBTITLE_BREAK|||\n{\\an8}Comment ça va?\n\nExample output:\n{\\i1}Hello{\\i0} world\n|||SUBTITLE_BREAK|||\n{\\an8}How are you?\n\nSubtitles to translate:\n{text}";
 
-/// Extract every `{...}` override-tag substring from an ASS dialogue line, in
+/// Iterate every `{...}` override-tag substring of an ASS dialogue line, in
 /// order. Each match starts at a `{` and runs to the next `}` (empty bodies
-/// allowed).
-fn ass_tags(text: &str) -> Vec<&str> {
-    let bytes = text.as_bytes();
-    let mut tags = Vec::new();
-    let mut i = 0;
-    while i < bytes.len() {
-        if bytes[i] == b'{' {
-            if let Some(rel) = text[i + 1..].find('}') {
-                let end = i + 1 + rel; // index of the closing '}'
-                tags.push(&text[i..=end]);
-                i = end + 1;
-                continue;
-            }
-            // No closing brace: the regex cannot match here; stop scanning.
-            break;
-        }
-        i += 1;
-    }
-    tags
+/// allowed); an unclosed `{` ends the scan.
+fn ass_tags(text: &str) -> impl Iterator<Item = &str> {
+    let mut rest = text;
+    std::iter::from_fn(move || {
+        let open = rest.find('{')?;
+        let close = open + 1 + rest[open + 1..].find('}')?;
+        let tag = &rest[open..=close];
+        rest = &rest[close + 1..];
+        Some(tag)
+    })
 }
 
 /// Whether `translated` preserves the exact ASS override tags of `original`
 /// (same `{...}` substrings, in the same order).
+///
+/// The two tag sequences are compared lazily, so a line whose tags diverge
+/// early is rejected without scanning the rest of either string.
 pub fn validate_ass_tags(original: &str, translated: &str) -> bool {
-    ass_tags(original) == ass_tags(translated)
+    ass_tags(original).eq(ass_tags(translated))
 }
 
 /// Translate a batch of cue texts in one model round-trip and realign the
 /// result.
 ///
 /// Joins `texts` with the newline-wrapped `separator_token` ([`join_batch`]),
-/// awaits `complete` on the formatted prompt, then splits the reply back into
+/// substitutes it for `{text}` in `prompt` (a template whose language
+/// placeholders [`fill_languages`] already filled), calls `complete` on the
+/// result, then the returned future awaits the reply and splits it back into
 /// per-cue blocks ([`split_batch`]). On a block-count mismatch the originals are
 /// kept for the whole batch. `complete` is an async callback that receives the
 /// fully-formed prompt and returns the model reply (already stripped, as the
 /// backends do); decoupling it from [`Backend`] lets callers drive the flow from
 /// a recorded map in tests.
-async fn translate_batch<E, F, Fut>(
-    texts: &[String],
-    source_lang: &str,
-    target_lang: &str,
-    separator_token: &str,
-    prompt_template: &str,
+///
+/// `complete` is called eagerly and only its future is kept, so the result
+/// does not borrow `complete` and several batches can be in flight at once.
+fn translate_batch<'a, E, F, Fut>(
+    texts: &'a [String],
+    separator_token: &'a str,
+    prompt: &str,
     complete: &mut F,
-) -> Result<Vec<String>, E>
+) -> impl Future<Output = Result<Vec<String>, E>> + use<'a, E, F, Fut>
 where
     F: FnMut(String) -> Fut,
     Fut: Future<Output = Result<String, E>>,
 {
     let combined = join_batch(texts, separator_token);
-    let prompt = format_prompt(prompt_template, source_lang, target_lang, &combined);
-    let translated = complete(prompt).await?;
-    Ok(split_batch(&translated, separator_token, texts))
+    let reply = complete(prompt.replace("{text}", &combined));
+    async move {
+        let translated = reply.await?;
+        Ok(split_batch(&translated, separator_token, texts))
+    }
 }
 
 /// Run the chunked batch-translation loop over `texts`, returning a
 /// translation aligned 1:1 with the input.
 ///
 /// Splits `texts` into batches of `chunk_size` ([`chunk_ranges`]), translating
-/// each via [`translate_batch`]. The returned vec has the same length as
-/// `texts`; a `chunk_size` of zero translates everything in a single batch.
+/// each via [`translate_batch`] with up to `max_concurrent` requests in flight
+/// (zero is treated as one); results are reassembled in batch order. The
+/// returned vec has the same length as `texts`; a `chunk_size` of zero
+/// translates everything in a single batch. The first error is returned and
+/// the remaining batches are dropped.
+#[expect(clippy::too_many_arguments)]
 async fn translate_chunks<E, F, Fut>(
     texts: &[String],
     source_lang: &str,
     target_lang: &str,
     chunk_size: usize,
+    max_concurrent: usize,
     separator_token: &str,
     prompt_template: &str,
     complete: &mut F,
@@ -697,21 +772,15 @@ where
     F: FnMut(String) -> Fut,
     Fut: Future<Output = Result<String, E>>,
 {
-    let mut out = Vec::with_capacity(texts.len());
-    for range in chunk_ranges(texts.len(), chunk_size) {
-        let batch = &texts[range];
-        let translated = translate_batch(
-            batch,
-            source_lang,
-            target_lang,
-            separator_token,
-            prompt_template,
-            complete,
-        )
+    let prompt = fill_languages(prompt_template, source_lang, target_lang);
+    let batches = chunk_ranges(texts.len(), chunk_size)
+        .into_iter()
+        .map(|range| translate_batch(&texts[range], separator_token, &prompt, complete));
+    let translated: Vec<Vec<String>> = futures::stream::iter(batches)
+        .buffered(max_concurrent.max(1))
+        .try_collect()
         .await?;
-        out.extend(translated);
-    }
-    Ok(out)
+    Ok(translated.into_iter().flatten().collect())
 }
 
 /// Translate raw SRT content, preserving cue indices and timing.
@@ -719,7 +788,8 @@ where
 /// Short-circuits and returns the input unchanged when `source_lang ==
 /// target_lang`. Otherwise parses with [`submate_subtitle::cue::parse_srt`],
 /// translates the cue contents in chunks of `chunk_size` (joined with
-/// [`SRT_SEPARATOR_TOKEN`] under [`TRANSLATION_PROMPT`]), writes the results
+/// [`SRT_SEPARATOR_TOKEN`] under [`TRANSLATION_PROMPT`], up to `max_concurrent`
+/// chunks in flight), writes the results
 /// back onto the cues, and re-emits via [`submate_subtitle::cue::compose_srt`].
 /// `complete` is awaited once per batch with the fully-formed prompt.
 pub async fn translate_srt_content<E, F, Fut>(
@@ -727,6 +797,7 @@ pub async fn translate_srt_content<E, F, Fut>(
     source_lang: &str,
     target_lang: &str,
     chunk_size: usize,
+    max_concurrent: usize,
     complete: &mut F,
 ) -> Result<String, E>
 where
@@ -738,12 +809,18 @@ where
     }
 
     let mut cues = submate_subtitle::cue::parse_srt(srt_content);
-    let texts: Vec<String> = cues.iter().map(|c| c.text.clone()).collect();
+    // Move the texts out rather than cloning them; each cue gets its text
+    // (translated, or the original on a batch mismatch) written back below.
+    let texts: Vec<String> = cues
+        .iter_mut()
+        .map(|c| std::mem::take(&mut c.text))
+        .collect();
     let translated = translate_chunks(
         &texts,
         source_lang,
         target_lang,
         chunk_size,
+        max_concurrent,
         SRT_SEPARATOR_TOKEN,
         TRANSLATION_PROMPT,
         complete,
@@ -768,6 +845,7 @@ pub async fn translate_vtt_content<E, F, Fut>(
     source_lang: &str,
     target_lang: &str,
     chunk_size: usize,
+    max_concurrent: usize,
     complete: &mut F,
 ) -> Result<String, E>
 where
@@ -783,12 +861,18 @@ where
         return Ok(vtt_content.to_string());
     }
 
-    let texts: Vec<String> = cues.iter().map(|c| c.text.clone()).collect();
+    // Move the texts out rather than cloning them; each cue gets its text
+    // (translated, or the original on a batch mismatch) written back below.
+    let texts: Vec<String> = cues
+        .iter_mut()
+        .map(|c| std::mem::take(&mut c.text))
+        .collect();
     let translated = translate_chunks(
         &texts,
         source_lang,
         target_lang,
         chunk_size,
+        max_concurrent,
         VTT_SEPARATOR_TOKEN,
         TRANSLATION_PROMPT,
         complete,
@@ -814,6 +898,7 @@ pub async fn translate_ass_dialogue<E, F, Fut>(
     source_lang: &str,
     target_lang: &str,
     chunk_size: usize,
+    max_concurrent: usize,
     complete: &mut F,
 ) -> Result<Vec<String>, E>
 where
@@ -829,6 +914,7 @@ where
         source_lang,
         target_lang,
         chunk_size,
+        max_concurrent,
         VTT_SEPARATOR_TOKEN,
         ASS_TRANSLATION_PROMPT,
         complete,
@@ -895,7 +981,7 @@ where
 ///    is swallowed and the original `content` is returned, degrading to the
 ///    untranslated text rather than failing the Bazarr request.
 ///
-/// `chunk_size` is forwarded to the SRT/VTT batch loop; `complete` is the
+/// `chunk_size` and `max_concurrent` are forwarded to the SRT/VTT batch loop; `complete` is the
 /// closure-driven LLM entrypoint shared with the sibling translate fns. The
 /// return type is `String` (not `Result`) precisely because the fallback
 /// absorbs every error into the verbatim `content`.
@@ -905,6 +991,7 @@ pub async fn translate_content<E, F, Fut>(
     target_lang: &str,
     output_format: submate_types::OutputFormat,
     chunk_size: usize,
+    max_concurrent: usize,
     complete: &mut F,
 ) -> String
 where
@@ -919,10 +1006,26 @@ where
 
     let result: Result<String, E> = match output_format {
         OutputFormat::Srt => {
-            translate_srt_content(content, source_lang, target_lang, chunk_size, complete).await
+            translate_srt_content(
+                content,
+                source_lang,
+                target_lang,
+                chunk_size,
+                max_concurrent,
+                complete,
+            )
+            .await
         }
         OutputFormat::Vtt => {
-            translate_vtt_content(content, source_lang, target_lang, chunk_size, complete).await
+            translate_vtt_content(
+                content,
+                source_lang,
+                target_lang,
+                chunk_size,
+                max_concurrent,
+                complete,
+            )
+            .await
         }
         OutputFormat::Txt => translate_text(content, source_lang, target_lang, complete).await,
         // JSON holds the full result dump and ASS has no content-level
@@ -1058,7 +1161,7 @@ mod tests {
         let mut complete = async |_: String| -> Result<String, Infallible> {
             panic!("backend must not be called when source == target");
         };
-        let out = translate_srt_content(srt, "en", "en", 50, &mut complete)
+        let out = translate_srt_content(srt, "en", "en", 50, 1, &mut complete)
             .await
             .unwrap();
         assert_eq!(out, srt);
@@ -1071,7 +1174,7 @@ mod tests {
         let mut complete = async |_: String| -> Result<String, Infallible> {
             Ok(format!("{{\\i1}}Hola{VTT_SEPARATOR_TOKEN}Mundo"))
         };
-        let out = translate_ass_dialogue(&texts, "en", "es", 50, &mut complete)
+        let out = translate_ass_dialogue(&texts, "en", "es", 50, 1, &mut complete)
             .await
             .unwrap();
         // First cue's tags preserved -> translation kept; second mismatched ->
@@ -1114,6 +1217,66 @@ mod tests {
         assert!(prompt.ends_with("Text to translate:\nHola."));
     }
 
+    /// The chunk loop fills the language pair once and `{text}` per batch;
+    /// every prompt must still equal a one-shot [`format_prompt`].
+    #[tokio::test]
+    async fn chunked_prompts_match_format_prompt() {
+        let texts: Vec<String> = ["a", "b", "c"].map(String::from).to_vec();
+        let seen: std::cell::RefCell<Vec<String>> = std::cell::RefCell::new(Vec::new());
+        let mut complete = async |prompt: String| -> Result<String, Infallible> {
+            seen.borrow_mut().push(prompt);
+            Ok(String::new())
+        };
+        translate_ass_dialogue(&texts, "fr", "en", 2, 1, &mut complete)
+            .await
+            .unwrap();
+        let expected: Vec<String> = [&texts[..2], &texts[2..]]
+            .into_iter()
+            .map(|batch| {
+                let combined = join_batch(batch, VTT_SEPARATOR_TOKEN);
+                format_prompt(ASS_TRANSLATION_PROMPT, "fr", "en", &combined)
+            })
+            .collect();
+        assert_eq!(seen.into_inner(), expected);
+    }
+
+    /// Batches overlap up to `max_concurrent` and are reassembled in input
+    /// order even when later replies arrive first; `1` keeps them sequential.
+    #[tokio::test]
+    async fn chunks_run_concurrently_in_order() {
+        let texts: Vec<String> = ["a", "b", "c", "d", "e"].map(String::from).to_vec();
+        for max_concurrent in [1, 3] {
+            let in_flight = std::cell::Cell::new(0usize);
+            let peak = std::cell::Cell::new(0usize);
+            let mut complete = |prompt: String| {
+                let (in_flight, peak) = (&in_flight, &peak);
+                // Earlier batches answer last.
+                let delay = Duration::from_millis(10 * u64::from(b'f' - prompt.as_bytes()[0]));
+                async move {
+                    in_flight.set(in_flight.get() + 1);
+                    peak.set(peak.get().max(in_flight.get()));
+                    tokio::time::sleep(delay).await;
+                    in_flight.set(in_flight.get() - 1);
+                    Ok::<_, Infallible>(prompt.to_uppercase())
+                }
+            };
+            let out = translate_chunks(
+                &texts,
+                "en",
+                "es",
+                1,
+                max_concurrent,
+                SRT_SEPARATOR_TOKEN,
+                "{text}",
+                &mut complete,
+            )
+            .await
+            .unwrap();
+            assert_eq!(out, ["A", "B", "C", "D", "E"]);
+            assert_eq!(peak.get(), max_concurrent);
+        }
+    }
+
     /// Falsifiers for `translate_content`'s per-format dispatch, the JSON skip,
     /// the same-lang/empty short-circuits, and the exception fallback. Each case
     /// records whether the LLM closure was invoked so the no-op branches are
@@ -1140,7 +1303,8 @@ mod tests {
                 Ok("Hola".to_string())
             };
             let out =
-                translate_content(SRT_IN, "en", "es", OutputFormat::Srt, 50, &mut complete).await;
+                translate_content(SRT_IN, "en", "es", OutputFormat::Srt, 50, 1, &mut complete)
+                    .await;
             assert!(called.get(), "SRT branch must call the LLM");
             assert!(out.contains("Hola"));
             assert!(out.contains("00:00:01,000 --> 00:00:02,000"));
@@ -1157,7 +1321,8 @@ mod tests {
                 Ok("Hola".to_string())
             };
             let out =
-                translate_content(VTT_IN, "en", "es", OutputFormat::Vtt, 50, &mut complete).await;
+                translate_content(VTT_IN, "en", "es", OutputFormat::Vtt, 50, 1, &mut complete)
+                    .await;
             assert!(called.get(), "VTT branch must call the LLM");
             assert!(out.contains("Hola"));
         }
@@ -1180,6 +1345,7 @@ mod tests {
                 "es",
                 OutputFormat::Txt,
                 50,
+                1,
                 &mut complete,
             )
             .await;
@@ -1196,7 +1362,7 @@ mod tests {
                 panic!("JSON format must skip translation (no LLM call)");
             };
             let out =
-                translate_content(json, "en", "es", OutputFormat::Json, 50, &mut complete).await;
+                translate_content(json, "en", "es", OutputFormat::Json, 50, 1, &mut complete).await;
             assert_eq!(out, json);
         }
 
@@ -1208,7 +1374,8 @@ mod tests {
                 panic!("same-language must short-circuit (no LLM call)");
             };
             let out =
-                translate_content(SRT_IN, "en", "en", OutputFormat::Srt, 50, &mut complete).await;
+                translate_content(SRT_IN, "en", "en", OutputFormat::Srt, 50, 1, &mut complete)
+                    .await;
             assert_eq!(out, SRT_IN);
         }
 
@@ -1218,7 +1385,8 @@ mod tests {
             let mut complete = async |_: String| -> Result<String, Infallible> {
                 panic!("empty content must short-circuit (no LLM call)");
             };
-            let out = translate_content("", "en", "es", OutputFormat::Srt, 50, &mut complete).await;
+            let out =
+                translate_content("", "en", "es", OutputFormat::Srt, 50, 1, &mut complete).await;
             assert_eq!(out, "");
         }
 
@@ -1230,7 +1398,8 @@ mod tests {
             struct Boom;
             let mut complete = async |_: String| -> Result<String, Boom> { Err(Boom) };
             let out =
-                translate_content(SRT_IN, "en", "es", OutputFormat::Srt, 50, &mut complete).await;
+                translate_content(SRT_IN, "en", "es", OutputFormat::Srt, 50, 1, &mut complete)
+                    .await;
             assert_eq!(out, SRT_IN, "failed translation degrades to original");
         }
     }
@@ -1439,6 +1608,7 @@ mod tests {
 
         use super::super::{
             AnthropicBackend, Backend, DEFAULT_CLAUDE_MODEL, RetryPolicy, backoff_ceiling,
+            retry_after, retry_after_delay,
         };
 
         /// A sub-millisecond policy so retry tests don't actually wait.
@@ -1447,6 +1617,8 @@ mod tests {
                 max_attempts,
                 base_delay: Duration::from_millis(1),
                 max_delay: Duration::from_millis(4),
+                max_retry_after: Duration::from_millis(4),
+                retry_after_jitter: Duration::from_millis(1),
             }
         }
 
@@ -1497,6 +1669,82 @@ mod tests {
             assert_eq!(calls_seen.load(Ordering::SeqCst), 3);
         }
 
+        #[test]
+        fn retry_after_reads_delta_seconds_only() {
+            use reqwest::header::{HeaderMap, HeaderValue, RETRY_AFTER};
+
+            let mut headers = HeaderMap::new();
+            assert_eq!(retry_after(&headers), None);
+            headers.insert(RETRY_AFTER, HeaderValue::from_static("7"));
+            assert_eq!(retry_after(&headers), Some(Duration::from_secs(7)));
+            // The HTTP-date form falls back to the computed backoff.
+            headers.insert(
+                RETRY_AFTER,
+                HeaderValue::from_static("Wed, 21 Oct 2015 07:28:00 GMT"),
+            );
+            assert_eq!(retry_after(&headers), None);
+        }
+
+        #[test]
+        fn retry_after_delay_caps_then_adds_jitter() {
+            let policy = RetryPolicy {
+                max_retry_after: Duration::from_secs(10),
+                retry_after_jitter: Duration::from_secs(1),
+                ..RetryPolicy::default()
+            };
+            let two = Duration::from_secs(2);
+            assert_eq!(retry_after_delay(two, &policy, 0.0), two);
+            assert_eq!(
+                retry_after_delay(two, &policy, 0.5),
+                Duration::from_millis(2500)
+            );
+            // The cap applies to the header, before the jitter.
+            assert_eq!(
+                retry_after_delay(Duration::from_secs(3600), &policy, 0.5),
+                Duration::from_millis(10_500)
+            );
+        }
+
+        #[tokio::test]
+        async fn honors_retry_after_capped_by_policy() {
+            let server = MockServer::start().await;
+            let calls = Arc::new(AtomicUsize::new(0));
+            let calls_seen = Arc::clone(&calls);
+            let reply = claude_reply();
+            Mock::given(method("POST"))
+                .and(path("/v1/messages"))
+                .respond_with(move |_: &Request| {
+                    // An hour-long Retry-After on the first attempt: the policy
+                    // cap (10ms here) must bound the wait, not the header.
+                    if calls.fetch_add(1, Ordering::SeqCst) == 0 {
+                        ResponseTemplate::new(429).insert_header("retry-after", "3600")
+                    } else {
+                        ResponseTemplate::new(200).set_body_json(reply.clone())
+                    }
+                })
+                .mount(&server)
+                .await;
+
+            // The computed backoff would wait 2.5-5s; a reply well inside that
+            // proves the (capped) header wait replaced it rather than being
+            // ignored.
+            let policy = RetryPolicy {
+                max_attempts: 4,
+                base_delay: Duration::from_secs(5),
+                max_delay: Duration::from_secs(10),
+                max_retry_after: Duration::from_millis(10),
+                retry_after_jitter: Duration::from_millis(1),
+            };
+            let backend =
+                AnthropicBackend::with_retry("sk", DEFAULT_CLAUDE_MODEL, server.uri(), policy);
+
+            let reply = tokio::time::timeout(Duration::from_secs(1), backend.complete("Hello"))
+                .await
+                .expect("the capped Retry-After wait must replace the backoff");
+            assert_eq!(reply.unwrap(), "hola");
+            assert_eq!(calls_seen.load(Ordering::SeqCst), 2);
+        }
+
         #[tokio::test]
         async fn does_not_retry_client_error() {
             let server = MockServer::start().await;
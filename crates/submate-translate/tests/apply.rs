@@ -63,9 +63,10 @@ mod parity {
             Ok(completion.to_string())
         };
 
-        let actual = translate_srt_content(&input, "en", "es", DEFAULT_CHUNK_SIZE, &mut complete)
-            .await
-            .unwrap();
+        let actual =
+            translate_srt_content(&input, "en", "es", DEFAULT_CHUNK_SIZE, 1, &mut complete)
+                .await
+                .unwrap();
 
         let golden = std::fs::read_to_string(::fixtures::fixture_path("translate/sampleA.out.srt"))
             .expect("missing translate/sampleA.out.srt fixture");
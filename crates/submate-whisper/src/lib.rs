@@ -605,28 +605,82 @@ mod inference {
             return Ok(Arc::clone(ctx));
         }
         tracing::debug!(model = model_path, "loading whisper model (cache miss)");
+        let mut params = WhisperContextParameters::default();
+        params.flash_attn(whisper_flash_attn());
         let ctx = Arc::new(
-            WhisperContext::new_with_params(model_path, WhisperContextParameters::default())
+            WhisperContext::new_with_params(model_path, params)
                 .map_err(|e| WhisperError::Load(e.to_string()))?,
         );
         cache.insert(model_path.to_string(), Arc::clone(&ctx));
         Ok(ctx)
     }
 
-    /// Optional whisper.cpp thread-count override from `SUBMATE__WHISPER__THREADS`.
+    /// Load `model_path` into the process-wide context cache ahead of the first
+    /// transcription.
     ///
-    /// Returns `None` (leave whisper.cpp's own default of `min(4, n_cpu)`) unless
-    /// the env var is set. Measured on a 20-thread box with the `base` model,
-    /// raising the thread count above the default *regresses* (4→27s, 8→37s,
-    /// 20→113s): inference is memory-bandwidth-bound, so oversubscription
-    /// thrashes. The optimum is model- and host-dependent (a large model on many
-    /// physical cores may benefit), so we expose it as a knob instead of forcing
-    /// a value that helps in theory but hurts in practice.
-    fn whisper_threads() -> Option<std::os::raw::c_int> {
+    /// A long-lived server calls this at startup so its first request does not
+    /// pay the model load. The load runs on a blocking thread and goes through
+    /// [`load_context`], so a request racing it waits on the cache lock and
+    /// reuses the same context instead of loading a second copy.
+    pub async fn preload_model(model_path: impl Into<String>) -> Result<(), WhisperError> {
+        let model_path = model_path.into();
+        if !std::path::Path::new(&model_path).is_file() {
+            return Err(WhisperError::ModelNotFound(model_path));
+        }
+        install_whisper_logging();
+        tokio::task::spawn_blocking(move || load_context(&model_path).map(drop))
+            .await
+            .map_err(|e| WhisperError::Join(e.to_string()))?
+    }
+
+    /// whisper.cpp thread count: the `SUBMATE__WHISPER__THREADS` override when
+    /// set, else [`default_threads`].
+    ///
+    /// Measured on a 20-thread box with the `base` model, raising the thread
+    /// count above the default *regresses* (4→27s, 8→37s, 20→113s): inference
+    /// is memory-bandwidth-bound, so oversubscription thrashes. The optimum is
+    /// model- and host-dependent (a large model on many physical cores may
+    /// benefit), so we expose it as a knob instead of forcing a value that
+    /// helps in theory but hurts in practice.
+    fn whisper_threads() -> std::os::raw::c_int {
         std::env::var("SUBMATE__WHISPER__THREADS")
             .ok()
             .and_then(|v| v.parse::<usize>().ok())
-            .map(clamp_threads)
+            .map_or_else(
+                || {
+                    default_threads(
+                        std::thread::available_parallelism().map_or(1, std::num::NonZero::get),
+                    )
+                },
+                clamp_threads,
+            )
+    }
+
+    /// whisper.cpp's own default of `min(4, n_cpu)`, but over the CPUs this
+    /// process may actually use. whisper.cpp counts the host's cores, so under
+    /// a CPU affinity mask or a container CPU quota it starts more threads than
+    /// it can run; `available_parallelism` honours both.
+    fn default_threads(available: usize) -> std::os::raw::c_int {
+        clamp_threads(available.min(4))
+    }
+
+    /// Whether to build model contexts with flash attention, from
+    /// `SUBMATE__WHISPER__FLASH_ATTN`.
+    ///
+    /// Off unless set to a truthy value: the fused attention kernel is a large
+    /// encoder/decoder win on GPU backends, but support and speed vary by
+    /// backend and CPU builds may see no gain. It is a context parameter, so it
+    /// applies when a model is first loaded into [`context_cache`].
+    fn whisper_flash_attn() -> bool {
+        std::env::var("SUBMATE__WHISPER__FLASH_ATTN").is_ok_and(|v| is_truthy(&v))
+    }
+
+    /// `1`/`true`/`yes`/`on` (case-insensitive, surrounding whitespace ignored).
+    fn is_truthy(value: &str) -> bool {
+        let value = value.trim();
+        ["1", "true", "yes", "on"]
+            .iter()
+            .any(|t| value.eq_ignore_ascii_case(t))
     }
 
     /// Path to a Silero VAD model from `SUBMATE__WHISPER__VAD_MODEL`, or `None` to
@@ -733,11 +787,9 @@ mod inference {
             None => SamplingStrategy::Greedy { best_of: 1 },
         };
         let mut params = FullParams::new(strategy);
-        // Only override whisper.cpp's default thread count when explicitly asked
-        // (SUBMATE__WHISPER__THREADS) — forcing more threads regresses small models.
-        if let Some(threads) = whisper_threads() {
-            params.set_n_threads(threads);
-        }
+        // whisper.cpp's default thread count over the usable CPUs, unless
+        // SUBMATE__WHISPER__THREADS overrides it — more threads regress small models.
+        params.set_n_threads(whisper_threads());
         // Word-level timestamps: ask whisper.cpp to emit per-token times so we
         // can fold tokens into words below.
         params.set_token_timestamps(true);
@@ -891,7 +943,7 @@ mod inference {
 
     #[cfg(test)]
     mod tests {
-        use super::clamp_threads;
+        use super::{clamp_threads, default_threads, is_truthy};
 
         #[test]
         fn clamp_threads_stays_positive_and_in_range() {
@@ -902,11 +954,33 @@ mod inference {
             // Absurd counts saturate at c_int::MAX rather than wrapping negative.
             assert_eq!(clamp_threads(usize::MAX), std::os::raw::c_int::MAX);
         }
+
+        #[test]
+        fn default_threads_caps_at_four_usable_cpus() {
+            assert_eq!(default_threads(1), 1);
+            assert_eq!(
+                default_threads(2),
+                2,
+                "a 2-CPU quota must not start 4 threads"
+            );
+            assert_eq!(default_threads(4), 4);
+            assert_eq!(default_threads(64), 4);
+        }
+
+        #[test]
+        fn flash_attn_flag_accepts_common_truthy_spellings() {
+            for on in ["1", "true", "TRUE", " yes ", "On"] {
+                assert!(is_truthy(on), "{on:?} should enable");
+            }
+            for off in ["", "0", "false", "no", "off", "enabled"] {
+                assert!(!is_truthy(off), "{off:?} should not enable");
+            }
+        }
     }
 }
 
 #[cfg(feature = "model")]
-pub use inference::transcribe_pcm;
+pub use inference::{preload_model, transcribe_pcm};
 
 /// The submate config regroup string this pipeline drives by default.
 ///